@@ -5,14 +5,19 @@ user defines a JSON class. This is used by the framework to lookup class fields
 and class field settings.
 """
 from __future__ import annotations
-from jsonclasses.jobject import JObject
+from sys import intern
 from typing import Optional, Any, final, cast, TYPE_CHECKING
-from dataclasses import fields as dataclass_fields
+from functools import cached_property
+from itertools import chain
+from dataclasses import fields as dataclass_fields, MISSING
 from .jfield import JField
 from .fdef import FStore, DeleteRule
 from .rtypes import rtypes, rnamedtypes
 if TYPE_CHECKING:
+    from .jobject import JObject
     from .jconf import JConf
+    from .fdef import Fdef
+    from .modifiers import ChainedModifier
 
 
 @final
@@ -35,6 +40,7 @@ class Cdef:
         from .types import Types
         self._ref_names_resolved = False
         self._ref_types_resolved = False
+        self._rfields_resolved = False
         self._cls = cls
         jconf._cls = cls
         self._name: str = cls.__name__
@@ -42,57 +48,76 @@ class Cdef:
         self._list_fields: list[JField] = []
         self._dict_fields: dict[str, JField] = {}
         self._primary_field: Optional[JField] = None
-        self._calc_fields: list[JField] = []
-        self._setter_fields: list[JField] = []
-        self._deny_fields: list[JField] = []
-        self._nullify_fields: list[JField] = []
-        self._cascade_fields: list[JField] = []
-        self._field_names: list[str] = []
-        self._camelized_field_names: list[str] = []
-        self._reference_names: list[str] = []
-        self._camelized_reference_names: list[str] = []
-        self._unique_fields: list[JField] = []
-        self._assign_operator_fields: list[JField] = []
-        self._auth_identity_fields: list[JField] = []
-        self._auth_by_fields: list[JField] = []
+        self._primary_name: Optional[str] = None
+        self._reference_names: tuple[str, ...] = ()
+        self._camelized_reference_names: tuple[str, ...] = ()
+        field_names: list[str] = []
+        camelized_field_names: list[str] = []
+        calc_fields: list[JField] = []
+        setter_fields: list[JField] = []
+        deny_fields: list[JField] = []
+        nullify_fields: list[JField] = []
+        cascade_fields: list[JField] = []
+        unique_fields: list[JField] = []
+        assign_operator_fields: list[JField] = []
+        auth_identity_fields: list[JField] = []
+        auth_by_fields: list[JField] = []
+        delete_rule_fields = {DeleteRule.DENY: deny_fields,
+                              DeleteRule.NULLIFY: nullify_fields,
+                              DeleteRule.CASCADE: cascade_fields}
+        dict_fields = self._dict_fields
         for field in dataclass_fields(cls):
-            name = field.name
-            self._field_names.append(name)
-            if isinstance(field.default, Types):
-                types = field.default
-                default = None
-            elif field.default == cast(Any, field).default_factory:
-                types = rtypes(field.type)
+            name = intern(field.name)
+            field_names.append(name)
+            default = field.default
+            if isinstance(default, Types):
+                types = default
                 default = None
             else:
                 types = rtypes(field.type)
-                default = field.default
-            types.fdef._cdef = self
+                if default is MISSING and \
+                        cast(Any, field).default_factory is MISSING:
+                    default = None
+            fdef = types.fdef
+            fdef._cdef = self
             jfield = JField(cdef=self, name=name, default=default, types=types)
-            self._camelized_field_names.append(jfield.json_name)
+            camelized_field_names.append(intern(jfield.json_name))
             self._list_fields.append(jfield)
-            self._dict_fields[name] = jfield
-            if types.fdef._primary:
+            dict_fields[name] = jfield
+            if fdef._primary:
                 self._primary_field = jfield
-            if types.fdef._fstore == FStore.CALCULATED:
-                self._calc_fields.append(jfield)
-            if types.fdef._setter is not None:
-                self._setter_fields.append(jfield)
-            if types.fdef._delete_rule == DeleteRule.DENY:
-                self._deny_fields.append(jfield)
-            elif types.fdef._delete_rule == DeleteRule.NULLIFY:
-                self._nullify_fields.append(jfield)
-            elif types.fdef._delete_rule == DeleteRule.CASCADE:
-                self._cascade_fields.append(jfield)
-            if types.fdef._unique:
-                self._unique_fields.append(jfield)
-            if types.fdef._requires_operator_assign:
-                self._assign_operator_fields.append(jfield)
-            if types.fdef._auth_identity:
-                self._auth_identity_fields.append(jfield)
-            if types.fdef._auth_by:
-                self._auth_by_fields.append(jfield)
+                self._primary_name = name
+            if fdef._fstore == FStore.CALCULATED:
+                calc_fields.append(jfield)
+            if fdef._setter is not None:
+                setter_fields.append(jfield)
+            if fdef._delete_rule is not None:
+                rule_fields = delete_rule_fields.get(fdef._delete_rule)
+                if rule_fields is not None:
+                    rule_fields.append(jfield)
+            if fdef._unique:
+                unique_fields.append(jfield)
+            if fdef._requires_operator_assign:
+                assign_operator_fields.append(jfield)
+            if fdef._auth_identity:
+                auth_identity_fields.append(jfield)
+            if fdef._auth_by:
+                auth_by_fields.append(jfield)
         self._tuple_fields: tuple[JField, ...] = tuple(self._list_fields)
+        self._field_names: tuple[str, ...] = tuple(field_names)
+        self._camelized_field_names: tuple[str, ...] = tuple(
+            camelized_field_names)
+        self._calc_fields: tuple[JField, ...] = tuple(calc_fields)
+        self._setter_fields: tuple[JField, ...] = tuple(setter_fields)
+        self._deny_fields: tuple[JField, ...] = tuple(deny_fields)
+        self._nullify_fields: tuple[JField, ...] = tuple(nullify_fields)
+        self._cascade_fields: tuple[JField, ...] = tuple(cascade_fields)
+        self._unique_fields: tuple[JField, ...] = tuple(unique_fields)
+        self._assign_operator_fields: tuple[JField, ...] = tuple(
+            assign_operator_fields)
+        self._auth_identity_fields: tuple[JField, ...] = tuple(
+            auth_identity_fields)
+        self._auth_by_fields: tuple[JField, ...] = tuple(auth_by_fields)
 
     def _resolve_ref_types_if_needed(self: Cdef) -> None:
         if self._ref_types_resolved is False:
@@ -104,25 +129,49 @@ class Cdef:
             self._resolve_ref_names()
             self._ref_names_resolved = True
 
+    def _resolve_rfields_if_needed(self: Cdef) -> None:
+        if self._rfields_resolved is False:
+            self._resolve_rfields()
+            self._rfields_resolved = True
+
     def _resolve_types(self: Cdef) -> None:
         for jfield in self._tuple_fields:
             if jfield.types.fdef._unresolved:
                 cgraph = self.jconf.cgraph
                 jfield._types = rnamedtypes(jfield.types, cgraph, self.name)
 
+    def _resolve_rfields(self: Cdef) -> None:
+        self._rfields_by_name: dict[tuple[type, str], JField] = {}
+        self._rfields_by_fkey: dict[tuple[type, str], JField] = {}
+        for field in self._tuple_fields:
+            fcls = field.foreign_class
+            if fcls is None:
+                continue
+            self._rfields_by_name.setdefault((fcls, field.name), field)
+            fkey = field.fdef.foreign_key
+            if fkey is not None:
+                self._rfields_by_fkey.setdefault((fcls, fkey), field)
+
     def _resolve_ref_names(self: Cdef) -> None:
+        reference_names: list[str] = []
+        camelized_reference_names: list[str] = []
         for jfield in self._tuple_fields:
             if jfield.types.fdef._fstore == FStore.LOCAL_KEY:
                 ref_key_encoding_strategy = self.jconf.ref_key_encoding_strategy
-                self._reference_names.append(ref_key_encoding_strategy(jfield))
-                self._camelized_reference_names.append(
-                    self.jconf.key_encoding_strategy(ref_key_encoding_strategy(jfield)))
-        self._available_names: set[str] = set(self._field_names
-                                              + self._camelized_field_names
-                                              + self._reference_names
-                                              + self._camelized_reference_names)
-        self._update_names: set[str] = set(self._field_names
-                                           + self._reference_names)
+                reference_names.append(
+                    intern(ref_key_encoding_strategy(jfield)))
+                camelized_reference_names.append(intern(
+                    self.jconf.key_encoding_strategy(ref_key_encoding_strategy(jfield))))
+        self._reference_names = tuple(reference_names)
+        self._camelized_reference_names = tuple(camelized_reference_names)
+        self._available_names: frozenset[str] = frozenset(chain(
+            self._field_names,
+            self._camelized_field_names,
+            self._reference_names,
+            self._camelized_reference_names))
+        self._update_names: frozenset[str] = frozenset(chain(
+            self._field_names,
+            self._reference_names))
 
     @property
     def cls(self: Cdef) -> type:
@@ -157,9 +206,16 @@ class Cdef:
         Raises:
             ValueError: If can't find a field with name `name`.
         """
-        if not self._dict_fields.get(name):
+        field = self._dict_fields.get(name)
+        if field is None:
             raise ValueError(f'no field named {name} in class definition')
-        return self._dict_fields[name]
+        return field
+
+    def _field_by_interned(self: Cdef, name: str) -> Optional[JField]:
+        """Get the field which is named `name`. Unlike `field_named`, this
+        returns None instead of raising if there is no such field.
+        """
+        return self._dict_fields.get(name)
 
     @property
     def fields(self: Cdef) -> tuple[JField, ...]:
@@ -168,50 +224,58 @@ class Cdef:
         """
         return self._tuple_fields
 
+    @cached_property
+    def _compiled_fields(
+            self: Cdef
+    ) -> tuple[tuple[JField, str, Fdef, ChainedModifier], ...]:
+        """The fields of this class definition prepared for the traversal
+        hot path. Each item is a tuple of the field, its name, its field
+        definition and its modifier. These are resolved once after reference
+        types are resolved, thus traversals don't walk the field properties
+        for every object.
+        """
+        self._resolve_ref_types_if_needed()
+        return tuple((field, field.name, field.fdef, field.modifier)
+                     for field in self._tuple_fields)
+
     @property
-    def calc_fields(self: Cdef) -> list[JField]:
+    def calc_fields(self: Cdef) -> tuple[JField, ...]:
         """Calculated fields of this class definition.
         """
         return self._calc_fields
 
-    @property
+    @cached_property
     def calc_field_names(self: Cdef) -> list[str]:
         """Names of calculated fields.
         """
-        if hasattr(self, '_calc_field_names'):
-            return self._calc_field_names
-        self._calc_field_names = list(map(lambda f: f.name, self._calc_fields))
-        return self._calc_field_names
+        return [f.name for f in self._calc_fields]
 
     @property
-    def setter_fields(self: Cdef) -> list[JField]:
+    def setter_fields(self: Cdef) -> tuple[JField, ...]:
         """Calculated fields with setter of this class definition.
         """
         return self._setter_fields
 
-    @property
+    @cached_property
     def setter_field_names(self: Cdef) -> list[str]:
         """Names of calculated fields with setter.
         """
-        if hasattr(self, '_setter_field_names'):
-            return self._setter_field_names
-        self._setter_field_names = [f.name for f in self._setter_fields]
-        return self._setter_field_names
+        return [f.name for f in self._setter_fields]
 
     @property
-    def deny_fields(self: Cdef) -> list[JField]:
+    def deny_fields(self: Cdef) -> tuple[JField, ...]:
         """Reference fields with deny delete rule.
         """
         return self._deny_fields
 
     @property
-    def nullify_fields(self: Cdef) -> list[JField]:
+    def nullify_fields(self: Cdef) -> tuple[JField, ...]:
         """Reference fields with nullify delete rule.
         """
         return self._nullify_fields
 
     @property
-    def cascade_fields(self: Cdef) -> list[JField]:
+    def cascade_fields(self: Cdef) -> tuple[JField, ...]:
         """Reference fields with cascade delete rule.
         """
         return self._cascade_fields
@@ -224,26 +288,33 @@ class Cdef:
         return self._primary_field
 
     @property
-    def unique_fields(self: Cdef) -> list[JField]:
+    def primary_name(self: Cdef) -> Optional[str]:
+        """The name of the class definition's primary field. This can be None
+        if it's not defined by user.
+        """
+        return self._primary_name
+
+    @property
+    def unique_fields(self: Cdef) -> tuple[JField, ...]:
         """The unique fields of this class definition.
         """
         return self._unique_fields
 
     @property
-    def assign_operator_fields(self: Cdef) -> list[JField]:
+    def assign_operator_fields(self: Cdef) -> tuple[JField, ...]:
         """The class definition's fields which require operator assigning on
         object creation.
         """
         return self._assign_operator_fields
 
     @property
-    def auth_identity_fields(self: Cdef) -> list[JField]:
+    def auth_identity_fields(self: Cdef) -> tuple[JField, ...]:
         """Auth identity fields.
         """
         return self._auth_identity_fields
 
     @property
-    def auth_by_fields(self: Cdef) -> list[JField]:
+    def auth_by_fields(self: Cdef) -> tuple[JField, ...]:
         """Auth by fields.
         """
         return self._auth_by_fields
@@ -251,24 +322,20 @@ class Cdef:
     def rfield(
             self: Cdef, fcls: type[JObject], fname: Optional[str],
             fkey: Optional[str]) -> Optional[JField]:
-        for field in self._tuple_fields:
-            if field.foreign_class is fcls:
-                if fname is not None:
-                    if field.name == fname:
-                        return field
-                elif fkey is not None:
-                    if field.fdef.foreign_key == fkey:
-                        return field
-        else:
-            return None
-
-    @property
-    def available_names(self: Cdef) -> set[str]:
+        self._resolve_rfields_if_needed()
+        if fname is not None:
+            return self._rfields_by_name.get((fcls, fname))
+        if fkey is not None:
+            return self._rfields_by_fkey.get((fcls, fkey))
+        return None
+
+    @cached_property
+    def available_names(self: Cdef) -> frozenset[str]:
         self._resolve_ref_names_if_needed()
         return self._available_names
 
-    @property
-    def update_names(self: Cdef) -> set[str]:
+    @cached_property
+    def update_names(self: Cdef) -> frozenset[str]:
         self._resolve_ref_names_if_needed()
         return self._update_names
 
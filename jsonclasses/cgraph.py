@@ -1,7 +1,7 @@
 """This module defineds the JSON class mapping graph."""
 from __future__ import annotations
 from typing import final, TYPE_CHECKING
-from enum import Enum
+from copy import copy
 from .jconf import JConf
 from .keypath import camelize_key, reference_key, underscore_key
 from .excs import (JSONClassRedefinitionException,
@@ -9,9 +9,30 @@ from .excs import (JSONClassRedefinitionException,
                          JSONClassNotFoundException,
                          JSONClassTypedDictNotFoundException)
 if TYPE_CHECKING:
+    from enum import Enum
     from .cdef import Cdef
 
 
+_DEFAULT_CONFIG_TEMPLATE = JConf(cgraph=None,
+                                 key_encoding_strategy=camelize_key,
+                                 key_decoding_strategy=underscore_key,
+                                 strict_input=True,
+                                 ref_key_encoding_strategy=reference_key,
+                                 validate_all_fields=False,
+                                 abstract=False,
+                                 reset_all_fields=False,
+                                 on_create=(),
+                                 on_update=(),
+                                 on_delete=(),
+                                 can_create=(),
+                                 can_update=(),
+                                 can_delete=(),
+                                 can_read=())
+"""The default configuration every class graph's default configuration is
+copied from.
+"""
+
+
 @final
 class CGraph:
     """JSON classes are defined on class graphs. Classes in the same graph
@@ -23,46 +44,38 @@ class CGraph:
     _graph_map: dict[str, CGraph] = {}
     """The graph map on which graph objects are stored."""
 
-    _initialized_map: dict[str, bool] = {}
-    """The map on which graphs' initialization status are recorded."""
-
     def __new__(cls: type[CGraph], name: str) -> CGraph:
-        """The `CGraph` class returns a shared graph object by it's
-        name.
-        """
-        if not cls._graph_map.get(name):
-            cls._graph_map[name] = super(CGraph, cls).__new__(cls)
-        return cls._graph_map.get(name)
-
-    def __init__(self: CGraph, name: str) -> None:
-        """Find a class graph by it's name. A new one is created if it's not
+        """Find a class graph by it's name. The `CGraph` class returns a
+        shared graph object by it's name. A new one is created if it's not
         exist.
 
         Args:
             name (str): The name of the graph.
         """
-        if self.__class__._initialized_map.get(name):
-            return
+        graph = cls._graph_map.get(name)
+        if graph is not None:
+            return graph
+        graph = super(CGraph, cls).__new__(cls)
+        cls._graph_map[name] = graph
+        graph._init(name)
+        return graph
+
+    def _init(self: CGraph, name: str) -> None:
+        """Initialize a newly created class graph. This is called only once
+        for each graph name.
+        """
         self._name: str = name
         self._map: dict[str, Cdef] = {}
         self._enum_map: dict[str, type] = {}
-        self._default_config = JConf(cgraph=self.name,
-                                     key_encoding_strategy=camelize_key,
-                                     key_decoding_strategy=underscore_key,
-                                     strict_input=True,
-                                     ref_key_encoding_strategy=reference_key,
-                                     validate_all_fields=False,
-                                     abstract=False,
-                                     reset_all_fields=False,
-                                     on_create=[],
-                                     on_update=[],
-                                     on_delete=[],
-                                     can_create=[],
-                                     can_update=[],
-                                     can_delete=[],
-                                     can_read=[])
-        self.__class__._initialized_map[name] = True
-        return None
+        self._default_config = copy(_DEFAULT_CONFIG_TEMPLATE)
+        self._default_config._cgraph = name
+
+    @staticmethod
+    def _as_name(name_or_class: str | type) -> str:
+        """Get the registered name from a name or a class."""
+        if isinstance(name_or_class, type):
+            return name_or_class.__name__
+        return name_or_class
 
     def __repr__(self) -> str:
         return f'[{self._name}]'
@@ -104,10 +117,12 @@ class CGraph:
             JSONClassNotFoundException: This exception is raised if a class \
                 definition with `name` is not found.
         """
-        if isinstance(name_or_class, type):
-            name = name_or_class.__name__
-        else:
-            name = name_or_class
+        return self._fetch_by_name(self._as_name(name_or_class))
+
+    def _fetch_by_name(self: CGraph, name: str) -> Cdef:
+        """Fetch a class by it's name. This is for framework internal callers
+        which already hold the name string.
+        """
         try:
             return self._map[name]
         except KeyError:
@@ -123,10 +138,12 @@ class CGraph:
         Returns:
             bool: Returns True if this class is registered in the graph.
         """
-        if isinstance(name_or_class, type):
-            name = name_or_class.__name__
-        else:
-            name = name_or_class
+        return self._has_by_name(self._as_name(name_or_class))
+
+    def _has_by_name(self: CGraph, name: str) -> bool:
+        """Test if class with name is registered in the graph. This is for
+        framework internal callers which already hold the name string.
+        """
         return self._map.get(name) is not None
 
     def put_enum(self: CGraph, enum_class: type[Enum]) -> None:
@@ -157,10 +174,12 @@ class CGraph:
             JSONClassNotFoundException: This exception is raised if a class \
                 definition with `name` is not found.
         """
-        if isinstance(ec_or_name, type):
-            name = ec_or_name.__name__
-        else:
-            name = ec_or_name
+        return self._fetch_enum_by_name(self._as_name(ec_or_name))
+
+    def _fetch_enum_by_name(self: CGraph, name: str) -> type[Enum]:
+        """Fetch a enum class by it's name. This is for framework internal
+        callers which already hold the name string.
+        """
         try:
             return self._enum_map[name]
         except KeyError:
@@ -176,8 +195,10 @@ class CGraph:
         Returns:
             bool: Returns True if this enum class is registered in the graph.
         """
-        if isinstance(ec_or_name, type):
-            name = ec_or_name.__name__
-        else:
-            name = ec_or_name
+        return self._has_enum_by_name(self._as_name(ec_or_name))
+
+    def _has_enum_by_name(self: CGraph, name: str) -> bool:
+        """Test if a enum class with name is registered in the graph. This is
+        for framework internal callers which already hold the name string.
+        """
         return self._enum_map.get(name) is not None
@@ -1,17 +1,19 @@
 """This module defines JSON Class context objects."""
 from __future__ import annotations
-from typing import Any, NamedTuple, Union, Optional, cast, TYPE_CHECKING
-from .jconf import JConf
+from typing import Any, Optional, cast, TYPE_CHECKING
+from dataclasses import dataclass, field
 from .types import types
 from .mgraph import MGraph
 from .excs import ValidationException
 if TYPE_CHECKING:
+    from .jconf import JConf
     from .cdef import Cdef
     from .fdef import Fdef
     from .jobject import JObject
 
 
-class CtxCfg(NamedTuple):
+@dataclass(slots=True)
+class CtxCfg:
 
     all_fields: Optional[bool] = None
     """On validating, whether validate all fields.
@@ -31,7 +33,13 @@ class CtxCfg(NamedTuple):
     """
 
 
-class Ctx(NamedTuple):
+@dataclass(slots=True)
+class Ctx:
+    """The context passed to modifiers. Derived contexts are constructed with
+    positional arguments on the hot path, keep the field order in sync with
+    these constructors when adding fields.
+    """
+
     root: JObject
     owner: JObject
     parent: list | dict | JObject
@@ -49,8 +57,8 @@ class Ctx(NamedTuple):
     fkeypathh: list[str | int]
     fdef: Fdef
     operator: Any
-    mgraph: MGraph = MGraph()
-    idchain: list[str] = []
+    mgraph: MGraph = field(default_factory=MGraph)
+    idchain: list[str] = field(default_factory=list)
     passin: Optional[Any] = None
 
     @property
@@ -141,136 +149,102 @@ class Ctx(NamedTuple):
                    passin=passin)
 
     def alterfdef(self: Ctx, fdef: Fdef) -> Ctx:
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent, holder=self.holder,
-                   val=self.val,
-                   original=self.original, ctxcfg=self.ctxcfg, keypatho=self.keypatho, fkeypatho=self.fkeypatho,
-                   keypathr=self.keypathr, fkeypathr=self.fkeypathr, keypathp=self.keypathp, fkeypathp=self.fkeypathp,
-                   keypathh=self.keypathh, fkeypathh=self.fkeypathh, fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph, idchain=self.idchain)
+        return Ctx(self.root, self.owner, self.parent, self.holder, self.val,
+                   self.original, self.ctxcfg, self.keypathr, self.fkeypathr,
+                   self.keypatho, self.fkeypatho, self.keypathp,
+                   self.fkeypathp, self.keypathh, self.fkeypathh, fdef,
+                   self.operator, self.mgraph, self.idchain, self.passin)
 
     def nval(self: Ctx, newval: Any) -> Ctx:
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent,
-                   holder=self.holder, val=newval, original=self.original,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=self.keypatho, fkeypatho=self.fkeypatho,
-                   keypathr=self.keypathr, fkeypathr=self.fkeypathr,
-                   keypathp=self.keypathp, fkeypathp=self.fkeypathp,
-                   keypathh=self.keypathh, fkeypathh=self.fkeypathh,
-                   fdef=self.fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        return Ctx(self.root, self.owner, self.parent, self.holder, newval,
+                   self.original, self.ctxcfg, self.keypathr, self.fkeypathr,
+                   self.keypatho, self.fkeypatho, self.keypathp,
+                   self.fkeypathp, self.keypathh, self.fkeypathh, self.fdef,
+                   self.operator, self.mgraph, self.idchain, self.passin)
+
+    def _ekey(self: Ctx, key: str | int) -> str | int:
+        """Encode a key of the owner. Field names use the field's cached JSON
+        name, other keys are encoded with the owner's key encoding strategy.
+        """
+        cdef = self.owner.__class__.cdef
+        jfield = cdef._dict_fields.get(key) if isinstance(key, str) else None
+        if jfield is None:
+            return cdef.jconf.key_encoding_strategy(key)
+        return jfield.json_name
 
     def nextv(self: Ctx, val: Any, key: str | int, fdef: Fdef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent,
-                   holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        ekey = self._ekey(key)
+        return Ctx(self.root, self.owner, self.parent, self.holder, val, None,
+                   self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, ekey],
+                   [*self.keypatho, key], [*self.fkeypatho, ekey],
+                   [*self.keypathp, key], [*self.fkeypathp, ekey],
+                   [*self.keypathh, key], [*self.fkeypathh, ekey],
+                   fdef, self.operator, self.mgraph, self.idchain,
+                   self.passin)
 
     def nexto(self: Ctx, val: Any, key: str | int, fdef: Fdef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=val, parent=val, holder=self.owner,
-                   val=val, original=None, ctxcfg=self.ctxcfg, keypatho=[],
-                   fkeypatho=[],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[], fkeypathp=[],
-                   keypathh=[key], fkeypathh=[ekey], fdef=fdef,
-                   operator=self.operator,
-                   mgraph=self.mgraph, idchain=self.idchain,
-                   passin=self.passin)
+        ekey = self._ekey(key)
+        return Ctx(self.root, val, val, self.owner, val, None, self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, ekey],
+                   [], [],
+                   [], [],
+                   [key], [ekey],
+                   fdef, self.operator, self.mgraph, self.idchain,
+                   self.passin)
 
     def nextvc(self: Ctx, val: Any, key: str | int, fdef: Fdef, c: str) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent,
-                   holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=[*self.idchain, c], passin=self.passin)
+        ekey = self._ekey(key)
+        return Ctx(self.root, self.owner, self.parent, self.holder, val, None,
+                   self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, ekey],
+                   [*self.keypatho, key], [*self.fkeypatho, ekey],
+                   [*self.keypathp, key], [*self.fkeypathp, ekey],
+                   [*self.keypathh, key], [*self.fkeypathh, ekey],
+                   fdef, self.operator, self.mgraph, [*self.idchain, c],
+                   self.passin)
 
     def nextoc(self: Ctx, val: Any, key: str | int, fdef: Fdef, c: str) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=val, parent=val, holder=self.owner,
-                   val=val, original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[],
-                   fkeypatho=[],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[],
-                   fkeypathp=[],
-                   keypathh=[key],
-                   fkeypathh=[ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=[*self.idchain, c], passin=self.passin)
+        ekey = self._ekey(key)
+        return Ctx(self.root, val, val, self.owner, val, None, self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, ekey],
+                   [], [],
+                   [], [],
+                   [key], [ekey],
+                   fdef, self.operator, self.mgraph, [*self.idchain, c],
+                   self.passin)
 
     def nextvo(self: Ctx, val: Any, key: str | int, fdef: Fdef, o: JObject) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=o, parent=self.parent,
-                   holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        ekey = self._ekey(key)
+        return Ctx(self.root, o, self.parent, self.holder, val, None,
+                   self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, ekey],
+                   [*self.keypatho, key], [*self.fkeypatho, ekey],
+                   [*self.keypathp, key], [*self.fkeypathp, ekey],
+                   [*self.keypathh, key], [*self.fkeypathh, ekey],
+                   fdef, self.operator, self.mgraph, self.idchain,
+                   self.passin)
 
     def colval(self: Ctx, val: Any, key: str | int, fdef: Fdef, p: Any) -> Ctx:
-        return Ctx(root=self.root, owner=self.owner, parent=p,
-                   holder=self.holder,
-                   val=val, original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, key],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, key],
-                   keypathp=[key],
-                   fkeypathp=[*self.fkeypathp, key],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, key],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        return Ctx(self.root, self.owner, p, self.holder, val, None,
+                   self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, key],
+                   [*self.keypatho, key], [*self.fkeypatho, key],
+                   [key], [*self.fkeypathp, key],
+                   [*self.keypathh, key], [*self.fkeypathh, key],
+                   fdef, self.operator, self.mgraph, self.idchain,
+                   self.passin)
 
     def default(self: Ctx, owner: JObject, key: str | int, fdef: Fdef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=owner, parent=owner,
-                   holder=self.holder, val=None,
-                   original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key], fdef=fdef,
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        ekey = self._ekey(key)
+        return Ctx(self.root, owner, owner, self.holder, None, None,
+                   self.ctxcfg,
+                   [*self.keypathr, key], [*self.fkeypathr, ekey],
+                   [*self.keypatho, key], [*self.fkeypatho, ekey],
+                   [*self.keypathp, key], [*self.fkeypathp, ekey],
+                   [*self.keypathh, key], [*self.fkeypathh, ekey],
+                   fdef, self.operator, self.mgraph, self.idchain,
+                   self.passin)
 
     def raise_vexc(self: Ctx, msg: str) -> None:
         """Raise validation error with message.
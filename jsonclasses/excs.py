@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 from inspect import getmodule, getsourcelines
+from functools import cached_property
 if TYPE_CHECKING:
     from .jobject import JObject
 
@@ -165,16 +166,27 @@ class ValidationException(Exception):
 
     def __init__(self, keypath_messages: dict[str, str], root: Any):
         self.keypath_messages = keypath_messages
-        self.message = self.formatted_keypath_messages()
         self.root = root
-        super().__init__(self.message)
+        super().__init__(keypath_messages)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple[type[ValidationException], tuple[Any, ...]]:
+        """The root object is not pickled with the exception."""
+        return (self.__class__, (self.keypath_messages, None))
+
+    @cached_property
+    def message(self) -> str:
+        """The formatted message. This is built on first access since nested
+        validation catches and merges exceptions which are never printed.
+        """
+        return self.formatted_keypath_messages()
 
     def formatted_keypath_messages(self):
         """The formatted keypath message for print."""
-        retval = 'Json classes validation failed:\n'
-        for k, v in self.keypath_messages.items():
-            retval += f'  \'{k}\': {v}\n'
-        return retval
+        return 'Json classes validation failed:\n' + ''.join(
+            f'  \'{k}\': {v}\n' for k, v in self.keypath_messages.items())
 
 
 class UnauthorizedActionException(Exception):
@@ -283,7 +283,8 @@ class Fdef:
         if self._enum_class is not None:
             return self._enum_class
         if isinstance(self._raw_enum_class, str):
-            ecls = self.cdef.jconf.cgraph.fetch_enum(self._raw_enum_class)
+            cgraph = self.cdef.jconf.cgraph
+            ecls = cgraph._fetch_enum_by_name(self._raw_enum_class)
             self._enum_class = ecls
         else:
             self._enum_class = self._raw_enum_class
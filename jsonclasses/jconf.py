@@ -2,7 +2,9 @@
 configuration object tweaks the behavior of JSON classes.
 """
 from __future__ import annotations
-from typing import Optional, Callable, Any, cast, final, TYPE_CHECKING
+from typing import (
+    Optional, Callable, Any, Sequence, cast, final, TYPE_CHECKING
+)
 from .jobject import JObject
 if TYPE_CHECKING:
     from .jfield import JField
@@ -19,6 +21,19 @@ CanDelete = Callable[[JObject, Any], bool | None | str]
 CanRead = Callable[[JObject, Any], bool | None | str]
 
 
+def _callbacks(value: Any) -> tuple[Any, ...]:
+    """Normalize a callback or guard argument into a tuple. Empty arguments
+    share the empty tuple, thus configurations without callbacks allocate
+    nothing.
+    """
+    from .types import Types
+    if callable(value) or isinstance(value, Types):
+        return (value,)
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return ()
+
+
 @final
 class JConf:
     """The configuration of JSON classes. Each JSON class has its own
@@ -35,13 +50,13 @@ class JConf:
                  validate_all_fields: Optional[bool],
                  abstract: Optional[bool],
                  reset_all_fields: Optional[bool],
-                 on_create: OnCreate | list[OnCreate] | Types | None,
-                 on_update: OnUpdate | list[OnUpdate] | Types | None,
-                 on_delete: OnDelete | list[OnDelete] | Types | None,
-                 can_create: CanCreate | list[CanCreate] | Types | None,
-                 can_update: CanUpdate | list[CanUpdate] | Types | None,
-                 can_delete: CanDelete | list[CanDelete] | Types | None,
-                 can_read: CanRead | list[CanRead] | Types | None) -> None:
+                 on_create: OnCreate | Sequence[OnCreate] | Types | None,
+                 on_update: OnUpdate | Sequence[OnUpdate] | Types | None,
+                 on_delete: OnDelete | Sequence[OnDelete] | Types | None,
+                 can_create: CanCreate | Sequence[CanCreate] | Types | None,
+                 can_update: CanUpdate | Sequence[CanUpdate] | Types | None,
+                 can_delete: CanDelete | Sequence[CanDelete] | Types | None,
+                 can_read: CanRead | Sequence[CanRead] | Types | None) -> None:
         """
         Initialize a new configuration object.
 
@@ -62,22 +77,21 @@ class JConf:
                 be initialized.
             reset_all_fields (Optional[bool]): Whether record all previous \
                 values of an object and enable reset functionality.
-            on_create (Optional[Union[OnCreate, list[OnCreate]]]): The callback
+            on_create (Optional[Union[OnCreate, Sequence[OnCreate]]]): The callback
                 on first time save.
-            on_update (Optional[Union[OnUpdate, list[OnUpdate]]]): The callback
+            on_update (Optional[Union[OnUpdate, Sequence[OnUpdate]]]): The callback
                 on existing object save.
-            on_delete (Optional[Union[OnDelete, list[OnDelete]]]): The callback
+            on_delete (Optional[Union[OnDelete, Sequence[OnDelete]]]): The callback
                 on existing object deletion.
-            can_create (Optional[Union[CanCreate, list[CanCreate]]]): The
+            can_create (Optional[Union[CanCreate, Sequence[CanCreate]]]): The
                 creation guard.
-            can_update (Optional[Union[CanUpdate, list[CanUpdate]]]): The
+            can_update (Optional[Union[CanUpdate, Sequence[CanUpdate]]]): The
                 updation guard.
-            can_delete (Optional[Union[CanDelete, list[CanDelete]]]): The
+            can_delete (Optional[Union[CanDelete, Sequence[CanDelete]]]): The
                 deletion guard.
-            can_read (Optional[Union[CanRead, list[CanRead]]]): The reading
+            can_read (Optional[Union[CanRead, Sequence[CanRead]]]): The reading
                 guard.
         """
-        from .types import Types
         self._cls: Optional[type[JObject]] = None
         self._cgraph = cgraph or 'default'
         self._key_encoding_strategy = key_encoding_strategy
@@ -87,48 +101,13 @@ class JConf:
         self._validate_all_fields = validate_all_fields
         self._abstract = abstract
         self._reset_all_fields = reset_all_fields
-        if callable(on_create) or isinstance(on_create, Types):
-            self._on_create = [on_create]
-        elif isinstance(on_create, list):
-            self._on_create = on_create
-        else:
-            self._on_create = []
-        if callable(on_update) or isinstance(on_update, Types):
-            self._on_update = [on_update]
-        elif isinstance(on_update, list):
-            self._on_update = on_update
-        else:
-            self._on_update = []
-        if callable(on_delete) or isinstance(on_delete, Types):
-            self._on_delete = [on_delete]
-        elif isinstance(on_delete, list):
-            self._on_delete = on_delete
-        else:
-            self._on_delete = []
-        if callable(can_create) or isinstance(can_create, Types):
-            self._can_create = [can_create]
-        elif isinstance(can_create, list):
-            self._can_create = can_create
-        else:
-            self._can_create = []
-        if callable(can_update) or isinstance(can_update, Types):
-            self._can_update = [can_update]
-        elif isinstance(can_update, list):
-            self._can_update = can_update
-        else:
-            self._can_update = []
-        if callable(can_delete) or isinstance(can_delete, Types):
-            self._can_delete = [can_delete]
-        elif isinstance(can_delete, list):
-            self._can_delete = can_delete
-        else:
-            self._can_delete = []
-        if callable(can_read) or isinstance(can_read, Types):
-            self._can_read = [can_read]
-        elif isinstance(can_read, list):
-            self._can_read = can_read
-        else:
-            self._can_read = []
+        self._on_create = _callbacks(on_create)
+        self._on_update = _callbacks(on_update)
+        self._on_delete = _callbacks(on_delete)
+        self._can_create = _callbacks(can_create)
+        self._can_update = _callbacks(can_update)
+        self._can_delete = _callbacks(can_delete)
+        self._can_read = _callbacks(can_read)
 
     def __eq__(self: JConf, other: Any) -> bool:
         if not isinstance(other, JConf):
@@ -238,43 +217,43 @@ class JConf:
         return self._reset_all_fields
 
     @property
-    def on_create(self: JConf) -> list[OnCreate | Types]:
+    def on_create(self: JConf) -> tuple[OnCreate | Types, ...]:
         """The object creation callback.
         """
         return self._on_create
 
     @property
-    def on_update(self: JConf) -> list[OnUpdate | Types]:
+    def on_update(self: JConf) -> tuple[OnUpdate | Types, ...]:
         """The object saving callback.
         """
         return self._on_update
 
     @property
-    def on_delete(self: JConf) -> list[OnDelete | Types]:
+    def on_delete(self: JConf) -> tuple[OnDelete | Types, ...]:
         """The object deleting callback.
         """
         return self._on_delete
 
     @property
-    def can_create(self: JConf) -> list[CanCreate | Types]:
+    def can_create(self: JConf) -> tuple[CanCreate | Types, ...]:
         """The object creation guard.
         """
         return self._can_create
 
     @property
-    def can_update(self: JConf) -> list[CanUpdate | Types]:
+    def can_update(self: JConf) -> tuple[CanUpdate | Types, ...]:
         """The object updation guard.
         """
         return self._can_update
 
     @property
-    def can_delete(self: JConf) -> list[CanDelete | Types]:
+    def can_delete(self: JConf) -> tuple[CanDelete | Types, ...]:
         """The object deletion guard.
         """
         return self._can_delete
 
     @property
-    def can_read(self: JConf) -> list[CanRead | Types]:
+    def can_read(self: JConf) -> tuple[CanRead | Types, ...]:
         """The object reading guard.
         """
         return self._can_read
@@ -25,6 +25,7 @@ class JField:
         self._name = name
         self._default = default
         self._types = types
+        self._json_name: Optional[str] = None
         self._resolved_foreign = False
         self._foreign_cdef = None
         self._foreign_field = None
@@ -48,7 +49,9 @@ class JField:
     def json_name(self: JField) -> str:
         """The name of the field when converted into JSON dict.
         """
-        return self.cdef.jconf.key_encoding_strategy(self._name)
+        if self._json_name is None:
+            self._json_name = self.cdef.jconf.key_encoding_strategy(self._name)
+        return self._json_name
 
     @property
     def default(self: JField) -> Any:
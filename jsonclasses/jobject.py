@@ -3,7 +3,8 @@ confirm to.
 """
 from __future__ import annotations
 from typing import (
-    Any, Callable, TypeVar, Optional, ClassVar, Protocol, Set, TYPE_CHECKING
+    Any, Callable, Sequence, TypeVar, Optional, ClassVar, Protocol, Set,
+    TYPE_CHECKING
 )
 if TYPE_CHECKING:
     from .cdef import Cdef
@@ -153,7 +154,7 @@ class JObject(Protocol):
     def _orm_restore(self: T) -> None: ...
 
     def _can_cu_check_common(self: T,
-                             callbacks: list[Callable | Types],
+                             callbacks: Sequence[Callable | Types],
                              action: str) -> None: ...
 
     def _can_create_or_update_check(self: T) -> None: ...
@@ -4,7 +4,7 @@ This module contains `jsonclass`, the decorator for JSON Classes.
 from __future__ import annotations
 from jsonclasses.keypath import identical_key
 from typing import (
-    Optional, Union, Callable, TypeVar, overload, cast, TYPE_CHECKING
+    Optional, Union, Callable, Sequence, TypeVar, overload, cast, TYPE_CHECKING
 )
 from dataclasses import dataclass
 from .jconf import (
@@ -38,13 +38,13 @@ def jsonclass(
     validate_all_fields: Optional[bool] = None,
     abstract: Optional[bool] = None,
     reset_all_fields: Optional[bool] = None,
-    on_create: OnCreate | list[OnCreate] | Types | None = None,
-    on_update: OnUpdate | list[OnUpdate] | Types | None = None,
-    on_delete: OnDelete | list[OnDelete] | Types | None = None,
-    can_create: CanCreate | list[CanCreate] | Types | None = None,
-    can_update: CanUpdate | list[CanUpdate] | Types | None = None,
-    can_delete: CanDelete | list[CanDelete] | Types | None = None,
-    can_read: CanRead | list[CanRead] | Types | None = None,
+    on_create: OnCreate | Sequence[OnCreate] | Types | None = None,
+    on_update: OnUpdate | Sequence[OnUpdate] | Types | None = None,
+    on_delete: OnDelete | Sequence[OnDelete] | Types | None = None,
+    can_create: CanCreate | Sequence[CanCreate] | Types | None = None,
+    can_update: CanUpdate | Sequence[CanUpdate] | Types | None = None,
+    can_delete: CanDelete | Sequence[CanDelete] | Types | None = None,
+    can_read: CanRead | Sequence[CanRead] | Types | None = None,
 ) -> Callable[[T], T | type[JObject]]: ...
 
 
@@ -60,13 +60,13 @@ def jsonclass(
     validate_all_fields: Optional[bool] = None,
     abstract: Optional[bool] = None,
     reset_all_fields: Optional[bool] = None,
-    on_create: OnCreate | list[OnCreate] | Types | None = None,
-    on_update: OnUpdate | list[OnUpdate] | Types | None = None,
-    on_delete: OnDelete | list[OnDelete] | Types | None = None,
-    can_create: CanCreate | list[CanCreate] | Types | None = None,
-    can_update: CanUpdate | list[CanUpdate] | Types | None = None,
-    can_delete: CanDelete | list[CanDelete] | Types | None = None,
-    can_read: CanRead | list[CanRead] | Types | None = None,
+    on_create: OnCreate | Sequence[OnCreate] | Types | None = None,
+    on_update: OnUpdate | Sequence[OnUpdate] | Types | None = None,
+    on_delete: OnDelete | Sequence[OnDelete] | Types | None = None,
+    can_create: CanCreate | Sequence[CanCreate] | Types | None = None,
+    can_update: CanUpdate | Sequence[CanUpdate] | Types | None = None,
+    can_delete: CanDelete | Sequence[CanDelete] | Types | None = None,
+    can_read: CanRead | Sequence[CanRead] | Types | None = None,
 ) -> T | type[JObject]: ...
 
 
@@ -81,13 +81,13 @@ def jsonclass(
     validate_all_fields: Optional[bool] = None,
     abstract: Optional[bool] = None,
     reset_all_fields: Optional[bool] = None,
-    on_create: OnCreate | list[OnCreate] | Types | None = None,
-    on_update: OnUpdate | list[OnUpdate] | Types | None = None,
-    on_delete: OnDelete | list[OnDelete] | Types | None = None,
-    can_create: CanCreate | list[CanCreate] | Types | None = None,
-    can_update: CanUpdate | list[CanUpdate] | Types | None = None,
-    can_delete: CanDelete | list[CanDelete] | Types | None = None,
-    can_read: CanRead | list[CanRead] | Types | None = None,
+    on_create: OnCreate | Sequence[OnCreate] | Types | None = None,
+    on_update: OnUpdate | Sequence[OnUpdate] | Types | None = None,
+    on_delete: OnDelete | Sequence[OnDelete] | Types | None = None,
+    can_create: CanCreate | Sequence[CanCreate] | Types | None = None,
+    can_update: CanUpdate | Sequence[CanUpdate] | Types | None = None,
+    can_delete: CanDelete | Sequence[CanDelete] | Types | None = None,
+    can_read: CanRead | Sequence[CanRead] | Types | None = None,
 ) -> Union[Callable[[T], T | type[JObject]], T | type[JObject]]:
     """The jsonclass object class decorator. To declare a jsonclass class, use
     this syntax:
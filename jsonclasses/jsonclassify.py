@@ -1,6 +1,6 @@
 """This module defines the `jsonclassify` function."""
 from __future__ import annotations
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Sequence, Union
 from datetime import datetime
 from inspect import signature, getmro
 from .jobject import JObject
@@ -27,6 +27,9 @@ from .excs import (AbstractJSONClassException, ValidationException,
                          UnauthorizedActionException)
 
 
+_MISSING = object()
+"""Sentinel for attributes which are not set yet."""
+
 
 def __init__(self: JObject, **kwargs: dict[str, Any]) -> None:
     """Initialize a new jsonclass object from keyed arguments or a dict.
@@ -476,7 +479,7 @@ def _orm_restore(self: JObject) -> None:
 
 
 def _can_cu_check_common(self: JObject,
-                         callbacks: list[Types | Callable],
+                         callbacks: Sequence[Types | Callable],
                          action: str) -> None:
     if len(callbacks) == 0:
         return
@@ -549,10 +552,10 @@ def _run_on_delete_callbacks(self: JObject) -> None:
 
 @property
 def _id(self: JObject) -> Union[str, int, None]:
-    field = self.__class__.cdef.primary_field
-    if not field:
+    name = self.__class__.cdef.primary_name
+    if name is None:
         return None
-    return getattr(self, field.name)
+    return getattr(self, name)
 
 
 def __is_private_attr__(name: str) -> bool:
@@ -581,9 +584,8 @@ def __setattr__(self: JObject, name: str, value: Any) -> None:
             setattr(self, '_is_modified', True)
             self._modified_fields.add(self._local_key_map[name])
     # use original setattr for non JSON class fields
-    try:
-        field = self.__class__.cdef.field_named(name)
-    except ValueError:
+    field = self.__class__.cdef._field_by_interned(name)
+    if field is None:
         self.__original_setattr__(name, value)
         return
     # this is a JSON class field attribute
@@ -597,7 +599,8 @@ def __setattr__(self: JObject, name: str, value: Any) -> None:
                 ctx = Ctx.rootctxp(self, name, None, value)
                 field.fdef.setter.modifier.transform(ctx)
             return
-    if hasattr(self, name) and value == getattr(self, name):
+    current = getattr(self, name, _MISSING)
+    if current is not _MISSING and value == current:
         lk = field.fdef.fstore is FStore.LOCAL_KEY
         value_none = value is None
         if lk and value_none:
@@ -621,8 +624,8 @@ def __setattr__(self: JObject, name: str, value: Any) -> None:
     if isinstance(value, dict):
         value = to_owned_dict(self, value, name)
     if field.fdef.is_ref:
-        if hasattr(self, name):
-            self.__unlink_field__(field, getattr(self, name))
+        if current is not _MISSING:
+            self.__unlink_field__(field, current)
         self.__original_setattr__(name, value)
         if field.fdef.fstore == FStore.LOCAL_KEY:
             if value is None:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import Any, Union, TYPE_CHECKING
 from re import split,search
+from functools import lru_cache
 from .fdef import FStore, FType
 if TYPE_CHECKING:
     from .jfield import JField
@@ -13,6 +14,7 @@ def raise_inflection_kindly():
                               'behavior or provide your own strategy')
 
 
+@lru_cache(maxsize=4096)
 def camelize_key(key: str) -> str:
     try:
         from inflection import camelize
@@ -21,6 +23,7 @@ def camelize_key(key: str) -> str:
     return camelize(key, False)
 
 
+@lru_cache(maxsize=4096)
 def underscore_key(key: str) -> str:
     try:
         from inflection import underscore
@@ -75,7 +78,7 @@ def concat_keypath(*args: Union[str, int]) -> str:
     Returns:
         str: the concatenated keypath.
     """
-    return '.'.join([str(arg) for arg in args if len(str(arg)) > 0])
+    return '.'.join(filter(None, map(str, args)))
 
 
 def keypath_drop_last(keypath: str) -> str:
@@ -9,5 +9,5 @@ class AbsModifier(Modifier):
     """Abs modifier transforms number value to its absolute value."""
 
     def transform(self, ctx: Ctx) -> Any:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         return abs(ctx.val) if is_number else ctx.val
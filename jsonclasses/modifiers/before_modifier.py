@@ -21,7 +21,7 @@ class BeforeModifier(Modifier):
         if type(value) is date:
             value = datetime.combine(ctx.val, datetime.min.time())
         if type(point) is date:
-            point = datetime.combine(self.resolve_param(self.point, ctx), datetime.min.time())
+            point = datetime.combine(point, datetime.min.time())
         if point is None:
             return ctx.val
         if value >= point:
@@ -10,5 +10,5 @@ class CeilModifier(Modifier):
     """Ceil modifier Ceil number value."""
 
     def transform(self, ctx: Ctx) -> Any:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         return ceil(ctx.val) if is_number else ctx.val
@@ -1,8 +1,8 @@
 """module for chained modifier."""
 from __future__ import annotations
 from jsonclasses.vmsgcollector import VMsgCollector
-from typing import Any, Optional, cast, TYPE_CHECKING
-from functools import reduce
+from typing import Any, Callable, Optional, cast, TYPE_CHECKING
+from functools import reduce, cached_property
 from ..excs import ValidationException
 from .modifier import Modifier
 from .eager_modifier import EagerModifier
@@ -67,6 +67,50 @@ class ChainedModifier(Modifier):
         """
         return self.vs[self._levidx:self._fpvidx]
 
+    @staticmethod
+    def _overrides(v: Modifier, name: str) -> bool:
+        """Whether modifier `v` overrides the no-op base implementation of
+        the method `name`.
+        """
+        return getattr(type(v), name) is not getattr(Modifier, name)
+
+    @cached_property
+    def _validate_fns(self) -> list[Callable[[Ctx], None]]:
+        """Bound validate methods of normal modifiers which actually
+        validate.
+        """
+        return [v.validate for v in self._nvs
+                if self._overrides(v, 'validate')]
+
+    @cached_property
+    def _transform_tvs(self) -> list[Modifier]:
+        """Eager modifiers which actually transform or validate."""
+        return [v for v in self._tvs if self._overrides(v, 'transform')
+                or self._overrides(v, 'validate')]
+
+    @cached_property
+    def _transform_fns(self) -> list[tuple[Callable[[Ctx], Any], bool]]:
+        """Bound transform methods of normal modifiers which actually
+        transform, paired with whether they are skipped on None values.
+        """
+        return [(v.transform, v.transform_skips_none) for v in self._nvs
+                if self._overrides(v, 'transform')]
+
+    @cached_property
+    def _tojson_fns(self) -> list[Callable[[Ctx], Any]]:
+        """Bound tojson methods of modifiers which actually output JSON
+        values.
+        """
+        return [v.tojson for v in self.vs if self._overrides(v, 'tojson')]
+
+    @cached_property
+    def _serialize_fns(self) -> list[Callable[[Ctx], Any]]:
+        """Bound serialize methods of eager and normal modifiers which
+        actually serialize, in chain order.
+        """
+        return [v.serialize for v in [*self._tvs, *self._nvs]
+                if self._overrides(v, 'serialize')]
+
     def _vt(self, v: Modifier, ctx: Ctx) -> Any:
         """Validate as transform."""
         retval = v.transform(ctx)
@@ -83,28 +127,35 @@ class ChainedModifier(Modifier):
 
     def validate(self, ctx: Ctx) -> None:
         ctor = VMsgCollector()
-        for modifier in self._nvs:
+        for validate in self._validate_fns:
             try:
-                modifier.validate(ctx)
+                validate(ctx)
             except ValidationException as exception:
-                ctor.receive(exception.keypath_messages)
                 if not ctx.ctxcfg.all_fields:
-                    break
+                    raise exception
+                ctor.receive(exception.keypath_messages)
         if ctor.has_msgs:
             ctx.raise_mvexc(ctor.messages)
 
     def transform(self, ctx: Ctx) -> Any:
         val = ctx.val
-        val = reduce(lambda val, v: self._vt(v, ctx.nval(val)), self._tvs, val)
-        val = reduce(lambda val, v: v.transform(ctx.nval(val)), self._nvs, val)
+        for v in self._transform_tvs:
+            val = self._vt(v, ctx.nval(val))
+        for transform, skips_none in self._transform_fns:
+            if skips_none and val is None:
+                continue
+            val = transform(ctx.nval(val))
         return val
 
     def tojson(self, ctx: Ctx) -> Any:
-        return reduce(lambda val, v: v.tojson(ctx.nval(val)), self.vs, ctx.val)
+        val = ctx.val
+        for tojson in self._tojson_fns:
+            val = tojson(ctx.nval(val))
+        return val
 
     def serialize(self, ctx: Ctx) -> Any:
         val = ctx.val
-        val = reduce(lambda val, v: v.serialize(ctx.nval(val)), self._tvs, val)
-        val = reduce(lambda val, v: v.serialize(ctx.nval(val)), self._nvs, val)
+        for serialize in self._serialize_fns:
+            val = serialize(ctx.nval(val))
         val = reduce(lambda val, v: self._sv(v, ctx.nval(val)), self._pvs, val)
         return val
@@ -53,14 +53,17 @@ class CollectionTypeModifier(TypeModifier):
             return
         super().validate(ctx)
         itypes = ctx.fdef.item_types
-        all_fields = next(b for b in [
-            ctx.ctxcfg.all_fields,
-            ctx.cdefowner.jconf.validate_all_fields] if b is not None)
+        ifdef = itypes.fdef
+        ivalidate = itypes.modifier.validate
+        all_fields = ctx.ctxcfg.all_fields
+        if all_fields is None:
+            all_fields = ctx.cdefowner.jconf.validate_all_fields
         vmsgctor = VMsgCollector()
-        for i, v in self.enumerator(ctx.val):
+        val = ctx.val
+        for i, v in self.enumerator(val):
             try:
-                ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
-                itypes.modifier.validate(ictx)
+                ictx = ctx.colval(v, i, ifdef, val)
+                ivalidate(ictx)
             except ValidationException as exception:
                 if all_fields:
                     vmsgctor.receive(exception.keypath_messages)
@@ -78,15 +81,18 @@ class CollectionTypeModifier(TypeModifier):
         if not isinstance(ctx.val, self.cls):
             return ctx.val
         itypes = ctx.fdef.item_types
+        ifdef = itypes.fdef
+        itransform = itypes.modifier.transform
+        jconf = ctx.owner.cdef.jconf
         retval = self.empty_collection()
-        for i, v in self.enumerator(ctx.val):
+        val = ctx.val
+        for i, v in self.enumerator(val):
             if self.should_special_handle(i, v, ctx):
                 self.special_handle(i, v, ctx)
             else:
-                ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
-                tsfmd = itypes.modifier.transform(ictx)
-                self.append_value(
-                    self.to_object_key(i, ctx.owner.cdef.jconf), tsfmd, retval)
+                ictx = ctx.colval(v, i, ifdef, val)
+                tsfmd = itransform(ictx)
+                self.append_value(self.to_object_key(i, jconf), tsfmd, retval)
         return retval
 
     def tojson(self, ctx: Ctx) -> Any:
@@ -95,12 +101,15 @@ class CollectionTypeModifier(TypeModifier):
         if not isinstance(ctx.val, self.cls):
             return ctx.val
         itypes = ctx.fdef.item_types
+        ifdef = itypes.fdef
+        itojson = itypes.modifier.tojson
+        jconf = ctx.owner.cdef.jconf
         retval = self.empty_collection()
-        for i, v in self.enumerator(ctx.val):
-            ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
-            tsfmd = itypes.modifier.tojson(ictx)
-            self.append_value(
-                    self.to_json_key(i, ctx.owner.cdef.jconf), tsfmd, retval)
+        val = ctx.val
+        for i, v in self.enumerator(val):
+            ictx = ctx.colval(v, i, ifdef, val)
+            tsfmd = itojson(ictx)
+            self.append_value(self.to_json_key(i, jconf), tsfmd, retval)
         return retval
 
     def serialize(self, ctx: Ctx) -> Any:
@@ -109,10 +118,13 @@ class CollectionTypeModifier(TypeModifier):
         if not isinstance(ctx.val, self.cls):
             return ctx.val
         itypes = ctx.fdef.item_types
+        ifdef = itypes.fdef
+        iserialize = itypes.modifier.serialize
+        jconf = ctx.cdefowner.jconf
         retval = self.empty_collection()
-        for i, v in self.enumerator(ctx.val):
-            ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
-            tsfmd = itypes.modifier.serialize(ictx)
-            self.append_value(
-                    self.to_json_key(i, ctx.cdefowner.jconf), tsfmd, retval)
+        val = ctx.val
+        for i, v in self.enumerator(val):
+            ictx = ctx.colval(v, i, ifdef, val)
+            tsfmd = iserialize(ictx)
+            self.append_value(self.to_json_key(i, jconf), tsfmd, retval)
         return retval
@@ -18,6 +18,7 @@ class CompareModifier(Modifier):
         if params_len < 2 or params_len > 3:
             raise ValueError('not a valid compare callable')
         self.compare_callable = compare_callable
+        self.params_len = params_len
 
     def validate(self, ctx: Ctx) -> None:
         from ..jobject import JObject
@@ -26,7 +27,7 @@ class CompareModifier(Modifier):
         if name not in parent.previous_values:
             return
         prev_value = parent.previous_values[cast(str, name)]
-        params_len = len(signature(self.compare_callable).parameters)
+        params_len = self.params_len
         if params_len == 2:
             result = self.compare_callable(prev_value, ctx.val)
         elif params_len == 3:
@@ -20,7 +20,8 @@ class CrossFetchModifier(Modifier):
 
     def transform(self, ctx: Ctx) -> Any:
         parent = ctx.parent
-        that_cls = parent.__class__.cdef.jconf.cgraph.fetch(self.cls_name).cls
+        cgraph = parent.__class__.cdef.jconf.cgraph
+        that_cls = cgraph._fetch_by_name(self.cls_name).cls
         that_val = getattr(parent, self.this_key)
         that_obj = that_cls.one(**{self.that_key: that_val}).optional.exec()
         if that_obj is None:
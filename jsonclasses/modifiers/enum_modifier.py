@@ -42,16 +42,15 @@ class EnumModifier(Modifier):
             except ValueError:
                 pass
         elif isinstance(ctx.val, str):
+            members = enum_class.__members__
             if enum_input.__contains__(EnumInput.NAME):
-                try:
-                    return enum_class[ctx.val]
-                except KeyError:
-                    pass
+                member = members.get(ctx.val)
+                if member is not None:
+                    return member
             if enum_input.__contains__(EnumInput.LOWERCASE_NAME):
-                try:
-                    return enum_class[ctx.val.upper()]
-                except KeyError:
-                    pass
+                member = members.get(ctx.val.upper())
+                if member is not None:
+                    return member
             ctx.raise_vexc('unknown enum value')
         else:
             ctx.raise_vexc('unknown enum value')
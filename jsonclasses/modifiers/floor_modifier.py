@@ -10,5 +10,5 @@ class FloorModifier(Modifier):
     """Floor modifier Floor number value."""
 
     def transform(self, ctx: Ctx) -> Any:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         return floor(ctx.val) if is_number else ctx.val
@@ -14,7 +14,7 @@ class GtModifier(Modifier):
         self.gt_value = gt_value
 
     def validate(self, ctx: Ctx) -> None:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         if is_number and ctx.val <= self.resolve_param(self.gt_value, ctx):
             ctx.raise_vexc('value is not greater than '
                            f'{self.gt_value}')
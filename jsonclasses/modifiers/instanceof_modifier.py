@@ -2,7 +2,7 @@
 from __future__ import annotations
 from jsonclasses.vmsgcollector import VMsgCollector
 from jsonclasses.jfield import JField
-from typing import Any, Sequence, Union, cast, TYPE_CHECKING
+from typing import Any, Collection, Union, cast, TYPE_CHECKING
 from ..fdef import (
     Fdef, FStore, FType, Nullability, WriteRule, ReadRule, Strictness
 )
@@ -45,19 +45,19 @@ class InstanceOfModifier(Modifier):
             modified_fields = list(initial_keypaths((ctx.val.modified_fields)))
         ctor = VMsgCollector()
         val = cast(JObject, ctx.val)
-        for field in val.__class__.cdef.fields:
-            fname = field.name
-            ffdef = field.fdef
-            fval = getattr(ctx.val, fname)
-            if field.fdef.fstore == FStore.EMBEDDED:
+        # bind enum members as locals, enum attribute access is slow
+        embedded, instance = FStore.EMBEDDED, FType.INSTANCE
+        for _, fname, ffdef, fmodifier in val.__class__.cdef._compiled_fields:
+            fval = getattr(val, fname)
+            if ffdef.fstore == embedded:
                 if only_validate_modified and fname not in modified_fields:
                     continue
             try:
-                if field.fdef.ftype == FType.INSTANCE:
+                if ffdef.ftype == instance:
                     fval_ctx = ctx.nexto(fval, fname, ffdef)
                 else:
                     fval_ctx = ctx.nextvo(fval, fname, ffdef, ctx.original or val)
-                field.types.modifier.validate(fval_ctx)
+                fmodifier.validate(fval_ctx)
             except ValidationException as exception:
                 if all_fields:
                     ctor.receive(exception.keypath_messages)
@@ -81,15 +81,9 @@ class InstanceOfModifier(Modifier):
             tsfmd = field.types.modifier.transform(dctx)
             setattr(dest, field.name, tsfmd)
 
-    def _has_field_value(self, field: JField, keys: Sequence[str]) -> bool:
+    def _has_field_value(self, field: JField, keys: Collection[str]) -> bool:
         return field.json_name in keys or field.name in keys
 
-    def _get_field_value(self, field: JField, ctx: Ctx) -> Any:
-        field_value = ctx.val.get(field.json_name)
-        if field_value is None:
-            field_value = ctx.val.get(field.name)
-        return field_value
-
     # pylint: disable=arguments-differ, too-many-locals, too-many-branches
     def transform(self, ctx: Ctx) -> Any:
         from ..types import Types
@@ -99,12 +93,12 @@ class InstanceOfModifier(Modifier):
             return ctx.original
         if not isinstance(ctx.val, dict):
             return ctx.original if ctx.original is not None else ctx.val
+        val = cast(dict[str, Any], ctx.val)
         # figure out types, cls and dest
         cls = cast(type[JObject], ctx.fdef.inst_cls)
-        pfield = cls.cdef.primary_field
-        if pfield:
-            pkey = pfield.name
-            pvalue = cast(Union[str, int, None], ctx.val.get(pkey))
+        pkey = cls.cdef.primary_name
+        if pkey is not None:
+            pvalue = cast(Union[str, int, None], val.get(pkey))
         else:
             pvalue = None
         soft_apply_mode = False
@@ -134,48 +128,57 @@ class InstanceOfModifier(Modifier):
         if strictness:
             self._strictness_check(ctx, dest)
         # fill values
-        dict_keys = list(ctx.val.keys())
+        cdef = dest.__class__.cdef
+        jconf = cdef.jconf
+        fill_dest_blanks = ctx.ctxcfg.fill_dest_blanks
+        dict_keys = val.keys()
         nonnull_ref_lists: list[str] = []
-        for field in dest.__class__.cdef.fields:
+        local_key, calculated = FStore.LOCAL_KEY, FStore.CALCULATED
+        no_write, write_once, write_nonnull = (
+            WriteRule.NO_WRITE, WriteRule.WRITE_ONCE, WriteRule.WRITE_NONNULL)
+        for field, fname, fdef, fmodifier in cdef._compiled_fields:
             if not self._has_field_value(field, dict_keys):
-                if field.fdef.is_ref:
-                    fdef = field.fdef
+                if fdef.is_ref:
                     if fdef.ftype == FType.LIST:
                         if fdef.collection_nullability == Nullability.NONNULL:
-                            nonnull_ref_lists.append(field.name)
-                    elif fdef.fstore == FStore.LOCAL_KEY:
-                        tsfm = dest.__class__.cdef.jconf.ref_key_encoding_strategy
-                        refname = tsfm(field)
-                        if ctx.val.get(refname) is not None:
-                            setattr(dest, refname, ctx.val.get(refname))
-                        crefname = dest.__class__.cdef.jconf.key_encoding_strategy(refname)
-                        if ctx.val.get(crefname) is not None:
-                            setattr(dest, refname, ctx.val.get(crefname))
+                            nonnull_ref_lists.append(fname)
+                    elif fdef.fstore == local_key:
+                        refname = jconf.ref_key_encoding_strategy(field)
+                        refvalue = val.get(refname)
+                        if refvalue is not None:
+                            setattr(dest, refname, refvalue)
+                        crefname = jconf.key_encoding_strategy(refname)
+                        crefvalue = val.get(crefname)
+                        if crefvalue is not None:
+                            setattr(dest, refname, crefvalue)
                     pass
-                elif ctx.ctxcfg.fill_dest_blanks and not soft_apply_mode:
-                    if field.fdef.fstore != FStore.CALCULATED:
+                elif fill_dest_blanks and not soft_apply_mode:
+                    if fdef.fstore != calculated:
                         self._fill_default_value(field, dest, ctx)
                 continue
-            field_value = self._get_field_value(field, ctx)
+            field_value = val.get(field.json_name)
+            if field_value is None:
+                field_value = val.get(fname)
             allow_write_field = True
-            if field.fdef.write_rule == WriteRule.NO_WRITE:
+            write_rule = fdef.write_rule
+            if write_rule == no_write:
                 allow_write_field = False
-            if field.fdef.write_rule == WriteRule.WRITE_ONCE:
-                cfv = getattr(dest, field.name)
+            if write_rule == write_once:
+                cfv = getattr(dest, fname)
                 if (cfv is not None) and (not isinstance(cfv, Types)):
                     allow_write_field = False
-            if field.fdef.write_rule == WriteRule.WRITE_NONNULL:
+            if write_rule == write_nonnull:
                 if field_value is None:
                     allow_write_field = False
             if not allow_write_field:
-                if ctx.ctxcfg.fill_dest_blanks:
-                    if field.fdef.fstore != FStore.CALCULATED:
+                if fill_dest_blanks:
+                    if fdef.fstore != calculated:
                         self._fill_default_value(field, dest, ctx)
                 continue
-            fctx = ctx.nextvo(field_value, field.name, field.fdef, dest)
-            tsfmd = field.types.modifier.transform(fctx)
-            if field.fdef.fstore != FStore.CALCULATED:
-                setattr(dest, field.name, tsfmd)
+            fctx = ctx.nextvo(field_value, fname, fdef, dest)
+            tsfmd = fmodifier.transform(fctx)
+            if fdef.fstore != calculated:
+                setattr(dest, fname, tsfmd)
         for cname in nonnull_ref_lists:
             if getattr(dest, cname) is None:
                 setattr(dest, cname, [])
@@ -188,35 +191,40 @@ class InstanceOfModifier(Modifier):
         val = cast(JObject, ctx.val)
         retval = {}
         clschain = ctx.idchain
-        cls_name = val.__class__.cdef.name
+        cdef = val.__class__.cdef
+        jconf = cdef.jconf
+        cls_name = cdef.name
         rr = ctx.ctxcfg.reverse_relationship
+        ignore_writeonly = ctx.ctxcfg.ignore_writeonly
         no_key_refs = cls_name in clschain
-        for field in val.__class__.cdef.fields:
-            fval = getattr(val, field.name)
-            fd = field.types.fdef
+        local_key, foreign_key, temp = (
+            FStore.LOCAL_KEY, FStore.FOREIGN_KEY, FStore.TEMP)
+        no_read, instance = ReadRule.NO_READ, FType.INSTANCE
+        for field, fname, fd, fmodifier in cdef._compiled_fields:
+            fval = getattr(val, fname)
             jf_name = field.json_name
-            ignore_writeonly = ctx.ctxcfg.ignore_writeonly
             isrr = False
             if not rr:
                 if field.foreign_field:
                     isrr = field.foreign_field.fdef == ctx.fdef
-            if fd.fstore == FStore.LOCAL_KEY:
-                rk = val.__class__.cdef.jconf.ref_key_encoding_strategy(field)
-                jrk = val.__class__.cdef.jconf.key_encoding_strategy(rk)
+            fstore = fd.fstore
+            if fstore == local_key:
+                rk = jconf.ref_key_encoding_strategy(field)
+                jrk = jconf.key_encoding_strategy(rk)
                 retval[jrk] = getattr(val, rk)
-            if fd.fstore == FStore.LOCAL_KEY and (isrr or no_key_refs):
+            if fstore == local_key and (isrr or no_key_refs):
                 continue
-            if fd.fstore == FStore.FOREIGN_KEY and (isrr or no_key_refs):
+            if fstore == foreign_key and (isrr or no_key_refs):
                 continue
-            if fd.read_rule == ReadRule.NO_READ and not ignore_writeonly:
+            if fd.read_rule == no_read and not ignore_writeonly:
                 continue
-            if fd.fstore == FStore.TEMP:
+            if fstore == temp:
                 continue
-            if field.fdef.ftype == FType.INSTANCE:
-                ictx = ctx.nextoc(fval, field.name, field.fdef, cls_name)
+            if fd.ftype == instance:
+                ictx = ctx.nextoc(fval, fname, fd, cls_name)
             else:
-                ictx = ctx.nextvc(fval, field.name, field.fdef, cls_name)
-            retval[jf_name] = field.types.modifier.tojson(ictx)
+                ictx = ctx.nextvc(fval, fname, fd, cls_name)
+            retval[jf_name] = fmodifier.tojson(ictx)
         return retval
 
     def serialize(self, ctx: Ctx) -> Any:
@@ -231,17 +239,18 @@ class InstanceOfModifier(Modifier):
         should_update = False
         if value.is_modified or value.is_new:
             should_update = True
-        for field in value.__class__.cdef.fields:
-            if field.fdef.is_ref or field.fdef.is_inst or should_update or field.fdef.force_set_on_save:
-                if field.fdef.fstore == FStore.LOCAL_KEY:
-                    if getattr(value, field.name) is None:
+        local_key = FStore.LOCAL_KEY
+        for field, fname, fdef, fmodifier in value.__class__.cdef._compiled_fields:
+            if fdef.is_ref or fdef.is_inst or should_update or fdef.force_set_on_save:
+                if fdef.fstore == local_key:
+                    if getattr(value, fname) is None:
                         tsf = value.__class__.cdef.jconf.ref_key_encoding_strategy
                         if getattr(value, tsf(field)) is not None:
                             continue
-                field_value = getattr(value, field.name)
-                fctx = ctx.nextv(field_value, field.name, field.fdef)
-                tsfmd = field.types.modifier.serialize(fctx)
-                setattr(value, field.name, tsfmd)
+                field_value = getattr(value, fname)
+                fctx = ctx.nextv(field_value, fname, fdef)
+                tsfmd = fmodifier.serialize(fctx)
+                setattr(value, fname, tsfmd)
                 if value.is_modified or value.is_new:
                     should_update = True
         return value
@@ -21,7 +21,7 @@ class LengthModifier(Modifier):
                 maxlength = minlength
             else:
                 maxlength = self.resolve_param(self.maxlength, ctx)
-            if len(ctx.val) > maxlength or len(ctx.val) < minlength:
+            if not minlength <= len(ctx.val) <= maxlength:
                 if minlength != maxlength:
                     msg = f'length of value is not between {minlength} and {maxlength}'
                 else:
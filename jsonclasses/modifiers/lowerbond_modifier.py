@@ -10,11 +10,13 @@ class LowerbondModifier(Modifier):
     """Lowerbond modifier returns the value of the field to lowerbond if
     the value of the field is smaller than lowerbond."""
 
+    transform_skips_none = True
+
     def __init__(self, min_value: int | float | Callable | Types) -> None:
         self.min_value = min_value
 
     def transform(self, ctx: Ctx) -> Any:
-        if type(ctx.val) is int or type(ctx.val) is float:
+        if type(ctx.val) in (int, float):
             min_value = self.resolve_param(self.min_value, ctx)
             return min_value if ctx.val < min_value else ctx.val
         return ctx.val
@@ -14,6 +14,7 @@ class LtModifier(Modifier):
         self.lt_value = lt_value
 
     def validate(self, ctx: Ctx) -> None:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
-        if is_number and ctx.val >= self.resolve_param(self.lt_value, ctx):
-            ctx.raise_vexc(f'value is not less than {self.resolve_param(self.lt_value, ctx)}')
+        if type(ctx.val) in (int, float):
+            lt_value = self.resolve_param(self.lt_value, ctx)
+            if ctx.val >= lt_value:
+                ctx.raise_vexc(f'value is not less than {lt_value}')
@@ -1,6 +1,7 @@
 """module for map modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable
+from sys import modules
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -8,14 +9,50 @@ if TYPE_CHECKING:
 class MapModifier(Modifier):
     """Map modifier maps number value."""
 
+    transform_skips_none = True
+
     def __init__(self, callback: Callable) -> None:
         if not callable(callback):
             raise ValueError('map callback is not callable')
         self.callback = callback
+        self._vectorizable = self._is_unary_ufunc(callback)
 
+    @staticmethod
+    def _is_unary_ufunc(callback: Callable) -> bool:
+        """A NumPy ufunc callback implies NumPy is already imported, so it's
+        detected without importing NumPy here. Only ufuncs with one input and
+        one output map element-wise.
+        """
+        np = modules.get('numpy')
+        if np is None:
+            return False
+        return isinstance(callback, np.ufunc) \
+            and callback.nin == 1 and callback.nout == 1
 
     def transform(self, ctx: Ctx) -> Any:
         if isinstance(ctx.val, list):
+            if self._vectorizable and ctx.val:
+                retval = self._vectorized(ctx.val)
+                if retval is not None:
+                    return retval
             return list(map(self.callback, ctx.val))
         else:
             return ctx.val
+
+    def _vectorized(self, val: list) -> list | None:
+        """Apply the ufunc to the whole list at once. This is only done for
+        lists of all ints which fit in int64 or all floats, thus no value is
+        promoted to another dtype. Returns None if the list doesn't qualify.
+        """
+        etypes = set(map(type, val))
+        if len(etypes) != 1:
+            return None
+        etype = etypes.pop()
+        if etype not in (int, float):
+            return None
+        np = modules['numpy']
+        try:
+            arr = np.asarray(val, dtype=np.int64 if etype is int else None)
+        except OverflowError:
+            return None
+        return list(self.callback(arr))
@@ -14,6 +14,7 @@ class MaxModifier(Modifier):
         self.max_value = max_value
 
     def validate(self, ctx: Ctx) -> None:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
-        if is_number and ctx.val > self.resolve_param(self.max_value, ctx):
-            ctx.raise_vexc(f'value is not less than or equal {self.resolve_param(self.max_value, ctx)}')
+        if type(ctx.val) in (int, float):
+            max_value = self.resolve_param(self.max_value, ctx)
+            if ctx.val > max_value:
+                ctx.raise_vexc(f'value is not less than or equal {max_value}')
@@ -14,7 +14,8 @@ class MinModifier(Modifier):
         self.min_value = min_value
 
     def validate(self, ctx: Ctx) -> None:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
-        if is_number and ctx.val < self.resolve_param(self.min_value, ctx):
-            ctx.raise_vexc('value is not greater than or equal '
-                           f'{self.resolve_param(self.min_value, ctx)}')
+        if type(ctx.val) in (int, float):
+            min_value = self.resolve_param(self.min_value, ctx)
+            if ctx.val < min_value:
+                ctx.raise_vexc('value is not greater than or equal '
+                               f'{min_value}')
@@ -1,6 +1,6 @@
 """module for modifier modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 from inspect import signature
 from ..fdef import Fdef
 from ..pkgutils import check_and_install_packages
@@ -11,19 +11,38 @@ if TYPE_CHECKING:
 class Modifier:
     """Abstract and base class for modifiers."""
 
+    transform_skips_none: bool = False
+    """Whether transform returns None for None values without side effects.
+    Chained modifiers don't call transform of these on None values.
+    """
+
     def packages(self) -> dict[str, (str, str)] | None:
         return None
 
     def check_packages(self) -> None:
         check_and_install_packages(self.packages())
 
+    def _params_len(self, param: Callable) -> int:
+        """The number of parameters of a param callable. Params are fixed
+        when the modifier is built, thus each is inspected once per modifier.
+        """
+        params_lens = self.__dict__.setdefault('_params_lens', {})
+        try:
+            params_len = params_lens.get(param)
+        except TypeError:
+            return len(signature(param).parameters)
+        if params_len is None:
+            params_len = len(signature(param).parameters)
+            params_lens[param] = params_len
+        return params_len
+
     def resolve_param(self, param: Any, ctx: Ctx) -> Any:
         from ..types import Types
         if isinstance(param, Types):
             newctx = ctx.nval(None)
             return param.modifier.transform(newctx)
         elif callable(param):
-            params_len = len(signature(param).parameters)
+            params_len = self._params_len(param)
             if params_len == 0:
                 return param()
             elif params_len == 1:
@@ -13,4 +13,4 @@ class MulModifier(Modifier):
         self.by = by
 
     def transform(self, ctx: Ctx) -> Any:
-        return self.resolve_param(self.by, ctx) * ctx.val if type(ctx.val) is int or type(ctx.val) is float else ctx.val
+        return self.resolve_param(self.by, ctx) * ctx.val if type(ctx.val) in (int, float) else ctx.val
@@ -11,6 +11,6 @@ class NonpositiveModifier(Modifier):
     """
 
     def validate(self, ctx: Ctx) -> None:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         if is_number and ctx.val > 0:
             ctx.raise_vexc('value is not nonpositive')
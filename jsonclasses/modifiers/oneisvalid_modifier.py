@@ -14,15 +14,19 @@ class OneIsValidModifier(Modifier):
     """One is valid modifier validates with subroutines."""
 
     def __init__(self, subroutines: list[Callable | Types]) -> None:
+        params_lens: list[int] = []
         for item in subroutines:
+            params_len = 0
             if callable(item):
                 params_len = len(signature(item).parameters)
                 if params_len > 2 or params_len < 1:
                     raise ValueError('not a valid or subroutine callable')
+            params_lens.append(params_len)
         self.subroutines = subroutines
+        self.params_lens = params_lens
 
     def validate(self, ctx: Ctx) -> None:
-        for item in self.subroutines:
+        for item, params_len in zip(self.subroutines, self.params_lens):
             from ..types import Types
             if isinstance(item, Types):
                 tresult = item.modifier.transform(ctx)
@@ -32,7 +36,6 @@ class OneIsValidModifier(Modifier):
                 except ValidationException:
                     continue
             else:
-                params_len = len(signature(item).parameters)
                 if params_len == 1:
                     result = callable(ctx.val)
                 elif params_len == 2:
@@ -17,9 +17,10 @@ class OnSaveModifier(Modifier):
         if params_len > 1:
             raise ValueError('not a valid onsave callable')
         self.callback = callback
+        self.params_len = params_len
 
     def serialize(self, ctx: Ctx) -> Any:
-        params_len = len(signature(self.callback).parameters)
+        params_len = self.params_len
         if params_len == 0:
             self.callback()
         elif params_len == 1:
@@ -19,6 +19,7 @@ class OnUpdateModifier(Modifier):
         if params_len > 3:
             raise ValueError('not a valid onupdate callable')
         self.callback = callback
+        self.params_len = params_len
 
     def serialize(self, ctx: Ctx) -> Any:
         from ..jobject import JObject
@@ -27,7 +28,7 @@ class OnUpdateModifier(Modifier):
         if name not in parent.previous_values:
             return ctx.val
         prev_value = parent.previous_values[name]
-        params_len = len(signature(self.callback).parameters)
+        params_len = self.params_len
         if params_len == 0:
             self.callback()
         elif params_len == 1:
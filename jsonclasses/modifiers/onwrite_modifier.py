@@ -19,6 +19,7 @@ class OnWriteModifier(Modifier):
         if params_len > 2:
             raise ValueError('not a valid onwrite callback')
         self.callback = callback
+        self.params_len = params_len
 
     def serialize(self, ctx: Ctx) -> Any:
         from ..jobject import JObject
@@ -26,7 +27,7 @@ class OnWriteModifier(Modifier):
         parent = cast(JObject, ctx.parent)
         if not parent.is_new and name not in parent.modified_fields:
             return ctx.val
-        params_len = len(signature(self.callback).parameters)
+        params_len = self.params_len
         if params_len == 0:
             self.callback()
         elif params_len == 1:
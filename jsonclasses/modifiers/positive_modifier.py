@@ -10,6 +10,6 @@ class PositiveModifier(Modifier):
     """Positive modifier marks value valid for large than zero."""
 
     def validate(self, ctx: Ctx) -> None:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         if is_number and ctx.val <= 0:
             ctx.raise_vexc('value is not positive')
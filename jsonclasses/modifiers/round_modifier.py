@@ -9,5 +9,5 @@ class RoundModifier(Modifier):
     """Round modifier rounds number value."""
 
     def transform(self, ctx: Ctx) -> Any:
-        is_number = type(ctx.val) is int or type(ctx.val) is float
+        is_number = type(ctx.val) in (int, float)
         return round(ctx.val) if is_number else ctx.val
@@ -19,12 +19,12 @@ class SetOnSaveModifier(Modifier):
             params_len = len(signature(setter).parameters)
             if params_len > 1:
                 raise ValueError('not a valid setonsave setter')
+            self.params_len = params_len
         self.setter = setter
 
     def serialize(self, ctx: Ctx) -> Any:
         if callable(self.setter):
-            params_len = len(signature(self.setter).parameters)
-            if params_len == 1:
+            if self.params_len == 1:
                 return self.setter(ctx.val)
             return self.setter()
         else:
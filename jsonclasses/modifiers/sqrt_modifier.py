@@ -10,7 +10,7 @@ class SqrtModifier(Modifier):
     """Sqrt modifier sqrts number value."""
 
     def transform(self, ctx: Ctx) -> Any:
-        if type(ctx.val) is int or type(ctx.val) is float:
+        if type(ctx.val) in (int, float):
             if(ctx.val >= 0):
                 return sqrt(ctx.val)
             else:
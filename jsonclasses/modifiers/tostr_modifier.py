@@ -10,5 +10,5 @@ class ToStrModifier(Modifier):
     """ToStr Modifier transforms value into a str"""
 
     def transform(self, ctx: Ctx) -> Any:
-        is_int_or_float_or_bool = type(ctx.val) is int or type(ctx.val) is float or type(ctx.val) is bool
+        is_int_or_float_or_bool = type(ctx.val) in (int, float, bool)
         return str(ctx.val) if is_int_or_float_or_bool else ctx.val
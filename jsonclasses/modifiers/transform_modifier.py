@@ -22,6 +22,8 @@ class TransformModifier(Modifier):
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid transformer')
             self.transformer = transformer
+            self.params_len = params_len
+            self.transform_skips_none = True
 
     def transform(self, ctx: Ctx) -> Any:
         from ..types import Types
@@ -29,7 +31,7 @@ class TransformModifier(Modifier):
             return self.transformer.modifier.transform(ctx)
         if ctx.val is None:
             return None
-        params_len = len(signature(self.transformer).parameters)
+        params_len = self.params_len
         if params_len == 1:
             return self.transformer(ctx.val)
         elif params_len == 2:
@@ -17,6 +17,7 @@ class UploaderModifier(Modifier):
             params_len = len(signature(arg).parameters)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid transformer')
+            self.params_len = params_len
         self.check_packages()
 
     def packages(self) -> dict[str, (str, str)] | None:
@@ -32,7 +33,7 @@ class UploaderModifier(Modifier):
         if ctx.val is None:
             return None
         if callable(self.arg):
-            params_len = len(signature(self.arg).parameters)
+            params_len = self.params_len
             if params_len == 1:
                 return self.arg(ctx.val)
             elif params_len == 2:
@@ -10,11 +10,13 @@ class UpperbondModifier(Modifier):
     """Upperbond modifier returns the value of the field to upperbond if
     the value of the field is larger than upperbond."""
 
+    transform_skips_none = True
+
     def __init__(self, max_value: int | float | Callable | Types) -> None:
         self.max_value = max_value
 
     def transform(self, ctx: Ctx) -> Any:
-        if type(ctx.val) is int or type(ctx.val) is float:
+        if type(ctx.val) in (int, float):
             max_value = self.resolve_param(self.max_value, ctx)
             return max_value if ctx.val > max_value else ctx.val
         return ctx.val
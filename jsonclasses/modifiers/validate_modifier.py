@@ -17,6 +17,7 @@ class ValidateModifier(Modifier):
             params_len = len(signature(validator).parameters)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid modifier')
+            self.params_len = params_len
         self.validator = validator
         self.msg = msg if msg is not None else 'invalid value'
         self.use_msg = msg is not None
@@ -32,7 +33,7 @@ class ValidateModifier(Modifier):
                 ctx.raise_vexc(self.msg)
         if ctx.val is None:
             return
-        params_len = len(signature(self.validator).parameters)
+        params_len = self.params_len
         if params_len == 1:
             result = self.validator(ctx.val)
         elif params_len == 2:
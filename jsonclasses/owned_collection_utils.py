@@ -32,11 +32,12 @@ def to_owned_list(owner: ListOwner,
                   lst: list[T],
                   keypath: str) -> OwnedList[T]:
     new_lst = []
+    prefix = f'{keypath}.' if keypath else ''
     for i, v in enumerate(lst):
         if isinstance(v, list):
-            new_lst.append(to_owned_list(owner, v, concat_keypath(keypath, i)))
+            new_lst.append(to_owned_list(owner, v, f'{prefix}{i}'))
         elif isinstance(v, dict):
-            new_lst.append(to_owned_dict(owner, v, concat_keypath(keypath, i)))
+            new_lst.append(to_owned_dict(owner, v, f'{prefix}{i}'))
         else:
             new_lst.append(v)
     owned_list = OwnedList[Any](new_lst)
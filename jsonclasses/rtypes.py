@@ -275,11 +275,11 @@ def rnamedtypes(types: Types, cgraph: CGraph, cname: str) -> Types:
     if not types.fdef._unresolved_name:
         return types
     name = types.fdef._unresolved_name
-    if cgraph.has(name):
-        cdef = cgraph.fetch(name)
+    if cgraph._has_by_name(name):
+        cdef = cgraph._fetch_by_name(name)
         types = types.instanceof(cdef.cls)
-    elif cgraph.has_enum(name):
-        enumcls = cgraph.fetch_enum(name)
+    elif cgraph._has_enum_by_name(name):
+        enumcls = cgraph._fetch_enum_by_name(name)
         types = types.enum(enumcls)
     else:
         raise UnresolvedTypeNameException(
@@ -0,0 +1,22 @@
+from __future__ import annotations
+from typing import Any, Optional, TYPE_CHECKING
+from jsonclasses import jsonclass, types
+from jsonclasses.types import Types
+from jsonclasses.modifiers import Modifier
+if TYPE_CHECKING:
+    from jsonclasses.ctx import Ctx
+
+
+class PrefixModifier(Modifier):
+    """Prefix modifier only outputs JSON values with a prefix."""
+
+    def tojson(self, ctx: Ctx) -> Any:
+        return None if ctx.val is None else 'x-' + ctx.val
+
+
+@jsonclass
+class ChainedDispatch:
+    nullable_code: Optional[str] = types.str.nullable.minlength(2)
+    readonly_code: Optional[str] = types.str.readonly.maxlength(3)
+    title: Optional[str] = types.str.maxlength(7).totitle.tocap
+    prefixed_code: Optional[str] = Types(types.str, PrefixModifier())
@@ -24,3 +24,10 @@ class GMArticle:
     name: str
     content: str
     author: GMAuthor
+
+
+@jsonclass(can_create=(check_owner, check_tier))
+class GMTupleArticle:
+    name: str
+    content: str
+    author: GMAuthor
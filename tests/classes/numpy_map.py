@@ -0,0 +1,10 @@
+from __future__ import annotations
+from typing import Any, Optional
+from numpy import absolute, negative
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class NumpyMap:
+    l_abs: Optional[list[Any]] = types.listof(types.any).map(absolute)
+    l_neg: Optional[list[Any]] = types.listof(types.any).map(negative)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class RfieldTask:
+    name: str
+    owner: Optional[RfieldOwner] = types.linkto.objof('RfieldOwner')
+
+
+@jsonclass
+class RfieldOwner:
+    name: str
+    tasks: list[RfieldTask] = types.listof('RfieldTask').linkedby('owner')
+    done_tasks: list[RfieldTask] = types.listof('RfieldTask') \
+                                        .linkedby('owner')
@@ -16,3 +16,8 @@ class CTransformName:
 @jsonclass
 class TTransformName:
     age: Optional[int] = types.int.transform(types.add(5).mul(5))
+
+
+@jsonclass
+class DTransformName:
+    age: Optional[int] = types.int.transform(types.default(7))
@@ -2,7 +2,9 @@ from __future__ import annotations
 from unittest import TestCase
 from jsonclasses.excs import UnauthorizedActionException
 from tests.classes.gs_article import GSArticle, GSAuthor, GSTArticle
-from tests.classes.gm_article import GMArticle, GMAuthor
+from tests.classes.gm_article import (
+    GMArticle, GMAuthor, GMTupleArticle, check_owner, check_tier
+)
 
 
 class TestCanCreate(TestCase):
@@ -62,6 +64,25 @@ class TestCanCreate(TestCase):
         article.opby(free_author)
         article.save()
 
+    def test_tuple_guards_are_called_for_new_objects_on_save(self):
+        article = GMTupleArticle(name='P', content='C')
+        paid_author = GMAuthor(id='P', name='A', paid_user=True)
+        article.author = paid_author
+        article.opby(paid_author)
+        article.save()
+        free_author = GMAuthor(id='F', name='A', paid_user=False)
+        article.author = free_author
+        article.opby(free_author)
+        with self.assertRaises(UnauthorizedActionException):
+            article.save()
+
+    def test_guards_are_stored_as_tuples(self):
+        self.assertEqual(GMArticle.cdef.jconf.can_create,
+                         (check_owner, check_tier))
+        self.assertEqual(GMTupleArticle.cdef.jconf.can_create,
+                         (check_owner, check_tier))
+        self.assertEqual(GMArticle.cdef.jconf.can_update, ())
+
     def test_types_guard_is_called_for_new_object_on_save(self):
         article = GSTArticle(name='P', content='C')
         paid_author = GSAuthor(id='P', name='P', paid_user=True)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.excs import ValidationException
+from tests.classes.chained_dispatch import ChainedDispatch
+
+
+class TestChainedModifier(TestCase):
+
+    def test_define_only_modifier_does_not_stop_validation(self):
+        item = ChainedDispatch(nullable_code='a')
+        with self.assertRaises(ValidationException) as context:
+            item.validate()
+        self.assertEqual(context.exception.keypath_messages['nullableCode'],
+                         'length of value is not greater than or equal 2')
+
+    def test_define_only_modifier_keeps_its_definition(self):
+        item = ChainedDispatch(readonly_code='abc')
+        self.assertEqual(item.readonly_code, None)
+        item.update(readonly_code='abcd')
+        with self.assertRaises(ValidationException) as context:
+            item.validate()
+        self.assertEqual(context.exception.keypath_messages['readonlyCode'],
+                         'length of value is not less than or equal 3')
+
+    def test_define_only_modifier_accepts_valid_value(self):
+        item = ChainedDispatch(nullable_code='ab')
+        item.update(readonly_code='abc')
+        item.validate()
+
+    def test_eager_chain_transforms_with_transform_only_modifiers(self):
+        item = ChainedDispatch(title='abc def')
+        self.assertEqual(item.title, 'Abc def')
+
+    def test_eager_chain_still_validates_before_transform(self):
+        with self.assertRaises(ValidationException) as context:
+            ChainedDispatch(title='abc defg')
+        self.assertEqual(context.exception.keypath_messages['title'],
+                         'length of value is not less than or equal 7')
+
+    def test_custom_tojson_only_modifier_outputs_json(self):
+        item = ChainedDispatch(prefixed_code='abc')
+        self.assertEqual(item.prefixed_code, 'abc')
+        self.assertEqual(item.tojson()['prefixedCode'], 'x-abc')
+        item.validate()
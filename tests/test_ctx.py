@@ -0,0 +1,29 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses import types
+from jsonclasses.ctx import Ctx
+from tests.classes.simple_secret import SimpleSecret
+
+
+class TestCtx(TestCase):
+
+    def test_alterfdef_keeps_passin(self):
+        secret = SimpleSecret(name='1')
+        ctx = Ctx.rootctxp(secret, 'name', None, '5')
+        fdef = types.str.fdef
+        altered = ctx.alterfdef(fdef)
+        self.assertIs(altered.fdef, fdef)
+        self.assertEqual(altered.passin, '5')
+        self.assertEqual(altered.keypathr, ['name'])
+
+    def test_passin_is_used_after_alterfdef(self):
+        secret = SimpleSecret(name='1')
+        ctx = Ctx.rootctxp(secret, 'name', None, '5')
+        passin = types.passin
+        altered = ctx.alterfdef(passin.fdef)
+        self.assertEqual(passin.modifier.transform(altered), '5')
+
+    def test_nval_keeps_passin(self):
+        secret = SimpleSecret(name='1')
+        ctx = Ctx.rootctxp(secret, 'name', None, '5')
+        self.assertEqual(ctx.nval('2').passin, '5')
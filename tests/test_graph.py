@@ -2,7 +2,8 @@ from __future__ import annotations
 from datetime import datetime
 from jsonclasses.excs import JSONClassGraphMergeConflictException
 from unittest import TestCase
-from tests.classes.blog import User, Post
+from tests.classes.blog import User, Post, Comment
+from tests.classes.rfield_owner import RfieldOwner, RfieldTask
 
 
 class TestGraph(TestCase):
@@ -45,3 +46,30 @@ class TestGraph(TestCase):
         post_new._mark_not_new()
         with self.assertRaises(JSONClassGraphMergeConflictException):
             user.posts = [post_new]
+
+    def test_rfield_finds_fields_to_same_class_by_name(self):
+        cdef = Comment.cdef
+        self.assertIs(cdef.rfield(Comment, 'parent', None),
+                      cdef.field_named('parent'))
+        self.assertIs(cdef.rfield(Comment, 'children', None),
+                      cdef.field_named('children'))
+
+    def test_rfield_finds_field_by_fkey(self):
+        self.assertIs(Comment.cdef.rfield(Comment, None, 'parent'),
+                      Comment.cdef.field_named('children'))
+        self.assertIs(User.cdef.rfield(Comment, None, 'commenter'),
+                      User.cdef.field_named('comments'))
+
+    def test_rfield_returns_first_match_for_shared_fkey(self):
+        self.assertIs(RfieldOwner.cdef.rfield(RfieldTask, None, 'owner'),
+                      RfieldOwner.cdef.field_named('tasks'))
+
+    def test_rfield_resolves_class_defined_later(self):
+        self.assertIs(RfieldTask.cdef.rfield(RfieldOwner, 'owner', None),
+                      RfieldTask.cdef.field_named('owner'))
+
+    def test_rfield_returns_none_on_miss(self):
+        self.assertIsNone(User.cdef.rfield(Comment, 'posts', None))
+        self.assertIsNone(User.cdef.rfield(Post, 'nonexist', None))
+        self.assertIsNone(User.cdef.rfield(Post, None, 'nonexist'))
+        self.assertIsNone(User.cdef.rfield(Post, None, None))
@@ -36,3 +36,10 @@ class TestLowerBond(TestCase):
     def test_lowerbond_does_not_transform_types_param_if_it_is_greater_than_types_val(self):
         n = SuperBond(t_lb=2)
         self.assertEqual(n.t_lb, 2)
+
+    def test_lowerbond_wont_handle_none(self):
+        n = SuperBond(i_lb=None, f_lb=None, c_lb=None, t_lb=None)
+        self.assertEqual(n.i_lb, None)
+        self.assertEqual(n.f_lb, None)
+        self.assertEqual(n.c_lb, None)
+        self.assertEqual(n.t_lb, None)
@@ -1,9 +1,52 @@
 from __future__ import annotations
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 from tests.classes.super_map import SuperMap
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
 
 class TestMap(TestCase):
 
     def test_map_does_not_raise_if_it_maps_list(self):
         item = SuperMap(l_m=[0, 1, 2, 3, 4])
         self.assertEqual(item.l_m, list(map(lambda a: a +1, [0, 1, 2, 3, 4])))
+
+    def test_map_wont_handle_none(self):
+        item = SuperMap(l_m=None)
+        self.assertEqual(item.l_m, None)
+
+    def assertMapsLikeBuiltinMap(self, result: list, expected: list):
+        self.assertEqual(result, expected)
+        self.assertEqual([type(v) for v in result],
+                         [type(v) for v in expected])
+
+    @skipUnless(numpy, 'numpy is not installed')
+    def test_map_ufunc_maps_int_list(self):
+        from tests.classes.numpy_map import NumpyMap
+        item = NumpyMap(l_neg=[0, 1, -2], l_abs=[0, 1, -2])
+        self.assertMapsLikeBuiltinMap(
+            item.l_neg, list(map(numpy.negative, [0, 1, -2])))
+        self.assertMapsLikeBuiltinMap(
+            item.l_abs, list(map(numpy.absolute, [0, 1, -2])))
+
+    @skipUnless(numpy, 'numpy is not installed')
+    def test_map_ufunc_maps_float_list(self):
+        from tests.classes.numpy_map import NumpyMap
+        item = NumpyMap(l_abs=[0.5, -1.5])
+        self.assertMapsLikeBuiltinMap(
+            item.l_abs, list(map(numpy.absolute, [0.5, -1.5])))
+
+    @skipUnless(numpy, 'numpy is not installed')
+    def test_map_ufunc_does_not_promote_mixed_list(self):
+        from tests.classes.numpy_map import NumpyMap
+        item = NumpyMap(l_abs=[1, 2.5])
+        self.assertMapsLikeBuiltinMap(
+            item.l_abs, list(map(numpy.absolute, [1, 2.5])))
+
+    @skipUnless(numpy, 'numpy is not installed')
+    def test_map_ufunc_does_not_promote_ints_out_of_int64(self):
+        from tests.classes.numpy_map import NumpyMap
+        item = NumpyMap(l_neg=[1, 2 ** 63])
+        self.assertMapsLikeBuiltinMap(
+            item.l_neg, list(map(numpy.negative, [1, 2 ** 63])))
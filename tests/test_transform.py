@@ -1,7 +1,7 @@
 from __future__ import annotations
 from unittest import TestCase
 from tests.classes.transform_name import (
-    TransformName, CTransformName, TTransformName
+    TransformName, CTransformName, TTransformName, DTransformName
 )
 
 
@@ -22,3 +22,11 @@ class TestTransform(TestCase):
     def test_transform_transforms_with_types(self):
         name = TTransformName(age=3)
         self.assertEqual(name.age, 40)
+
+    def test_transform_wont_handle_none_with_2_params(self):
+        name = CTransformName(name=None)
+        self.assertEqual(name.name, None)
+
+    def test_transform_with_types_handles_none(self):
+        name = DTransformName(age=None)
+        self.assertEqual(name.age, 7)
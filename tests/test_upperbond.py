@@ -36,3 +36,10 @@ class TestUpperBond(TestCase):
     def test_upperbond_does_not_transform_types_param_if_it_is_less_than_types_val(self):
         n = SuperBond(t_ub=100)
         self.assertEqual(n.t_ub, 100)
+
+    def test_upperbond_wont_handle_none(self):
+        n = SuperBond(i_ub=None, f_ub=None, c_ub=None, t_ub=None)
+        self.assertEqual(n.i_ub, None)
+        self.assertEqual(n.f_ub, None)
+        self.assertEqual(n.c_ub, None)
+        self.assertEqual(n.t_ub, None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from unittest import TestCase
+from pickle import dumps, loads
 from jsonclasses.excs import ValidationException
 from tests.classes.simple_article import SimpleArticle
 from tests.classes.simple_language import SimpleLanguage
@@ -20,6 +21,25 @@ class TestValidate(TestCase):
         article = SimpleArticle()
         self.assertRaises(ValidationException, article.validate)
 
+    def test_validation_exception_does_not_expose_root_in_args(self):
+        article = SimpleArticle()
+        with self.assertRaises(ValidationException) as context:
+            article.validate()
+        exception = context.exception
+        self.assertIs(exception.root, article)
+        self.assertEqual(exception.args, (exception.keypath_messages,))
+        self.assertNotIn('SimpleArticle', repr(exception))
+
+    def test_validation_exception_pickles_without_root(self):
+        article = SimpleArticle()
+        with self.assertRaises(ValidationException) as context:
+            article.validate()
+        exception = loads(dumps(context.exception))
+        self.assertEqual(exception.keypath_messages,
+                         context.exception.keypath_messages)
+        self.assertEqual(str(exception), str(context.exception))
+        self.assertIsNone(exception.root)
+
     def test_is_valid_returns_false_if_object_is_not_valid(self):
         article = SimpleArticle()
         self.assertEqual(False, article.is_valid)